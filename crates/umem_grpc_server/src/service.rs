@@ -1,4 +1,5 @@
-use tonic::{Code, Request, Response, Status};
+use futures::stream::{self, BoxStream, StreamExt};
+use tonic::{Code, Request, Response, Status, Streaming};
 use umem_controller::MemoryController;
 use umem_proto::{
     memory_service_server::MemoryService,
@@ -11,9 +12,18 @@ use umem_proto::{
     Memory,
     MemoryListResponse,
     MemoryResponse,
+    SearchError,
+    SearchMemoriesBatchRequest,
+    SearchMemoriesBatchResponse,
     SearchMemoriesRequest,
+    SearchMemoriesResult,
+    SearchMemoriesStreamRequest,
 };
 
+/// Number of queries from one `SearchMemoriesBatch` or `SearchMemoriesStream`
+/// call that are searched concurrently.
+const SEARCH_CONCURRENCY: usize = 8;
+
 pub struct ServiceImpl {
     memory_controller: MemoryController,
 }
@@ -110,14 +120,69 @@ impl MemoryService for ServiceImpl {
         &self,
         request: Request<SearchMemoriesRequest>,
     ) -> Result<Response<MemoryListResponse>, Status> {
+        Ok(Response::new(
+            Self::search(&self.memory_controller, request.into_inner()).await?,
+        ))
+    }
+
+    async fn search_memories_batch(
+        &self,
+        request: Request<SearchMemoriesBatchRequest>,
+    ) -> Result<Response<SearchMemoriesBatchResponse>, Status> {
         let request = request.into_inner();
 
+        // A failed search is reported in its own result rather than failing the batch
+        let results = stream::iter(request.requests)
+            .map(|r| Self::search(&self.memory_controller, r))
+            .buffered(SEARCH_CONCURRENCY)
+            .enumerate()
+            .map(|(index, result)| Self::search_result(index as u64, result))
+            .collect()
+            .await;
+
+        Ok(Response::new(SearchMemoriesBatchResponse { results }))
+    }
+
+    type SearchMemoriesStreamStream = BoxStream<'static, Result<SearchMemoriesResult, Status>>;
+
+    async fn search_memories_stream(
+        &self,
+        request: Request<Streaming<SearchMemoriesStreamRequest>>,
+    ) -> Result<Response<Self::SearchMemoriesStreamStream>, Status> {
+        let memory_controller = self.memory_controller.clone();
+
+        // Results carry the client's call_id, so they are sent as soon as each search
+        // finishes rather than in request order. A failed search is reported in its
+        // result; only a broken request stream ends the RPC.
+        let responses = request
+            .into_inner()
+            .map(move |request| {
+                let memory_controller = memory_controller.clone();
+                async move {
+                    let SearchMemoriesStreamRequest { call_id, request } = request?;
+                    let result = match request {
+                        Some(request) => Self::search(&memory_controller, request).await,
+                        None => Err(Status::new(Code::InvalidArgument, "request must be passed")),
+                    };
+                    Ok(Self::search_result(call_id, result))
+                }
+            })
+            .buffer_unordered(SEARCH_CONCURRENCY);
+
+        Ok(Response::new(responses.boxed()))
+    }
+}
+
+impl ServiceImpl {
+    async fn search(
+        memory_controller: &MemoryController,
+        request: SearchMemoriesRequest,
+    ) -> Result<MemoryListResponse, Status> {
         if request.context.is_none() {
             return Err(Status::new(Code::InvalidArgument, "context must be passed"));
         }
 
-        let memories = self
-            .memory_controller
+        let memories = memory_controller
             .multi_search_with_context(
                 Self::map_context(request.context.unwrap())
                     .map_err(|e| Status::new(Code::InvalidArgument, e.to_string()))?,
@@ -127,13 +192,29 @@ impl MemoryService for ServiceImpl {
             .await
             .map_err(|e| Status::new(Code::Internal, e.to_string()))?;
 
-        Ok(Response::new(MemoryListResponse {
+        Ok(MemoryListResponse {
             memories: memories.into_iter().map(Self::map_memory).collect(),
-        }))
+        })
+    }
+
+    fn search_result(
+        call_id: u64,
+        result: Result<MemoryListResponse, Status>,
+    ) -> SearchMemoriesResult {
+        use umem_proto::search_memories_result::Result as SearchResult;
+
+        SearchMemoriesResult {
+            call_id,
+            result: Some(match result {
+                Ok(response) => SearchResult::Response(response),
+                Err(status) => SearchResult::Error(SearchError {
+                    code: status.code() as i32,
+                    message: status.message().to_string(),
+                }),
+            }),
+        }
     }
-}
 
-impl ServiceImpl {
     fn map_context(
         context: ContextFilter,
     ) -> Result<umem_core::MemoryContext, umem_core::MemoryContextError> {
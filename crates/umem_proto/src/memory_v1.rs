@@ -147,6 +147,21 @@ pub struct SearchMemoriesRequest {
     pub context: ::core::option::Option<ContextFilter>,
 }
 #[derive(Clone, PartialEq, Eq, Hash, ::prost::Message)]
+pub struct SearchMemoriesBatchRequest {
+    #[prost(message, repeated, tag = "1")]
+    pub requests: ::prost::alloc::vec::Vec<SearchMemoriesRequest>,
+}
+/// One query on SearchMemoriesStream. `call_id` is chosen by the client and
+/// echoed on the matching SearchMemoriesResult, since results may arrive out
+/// of order.
+#[derive(Clone, PartialEq, Eq, Hash, ::prost::Message)]
+pub struct SearchMemoriesStreamRequest {
+    #[prost(uint64, tag = "1")]
+    pub call_id: u64,
+    #[prost(message, optional, tag = "2")]
+    pub request: ::core::option::Option<SearchMemoriesRequest>,
+}
+#[derive(Clone, PartialEq, Eq, Hash, ::prost::Message)]
 pub struct MemoryResponse {
     #[prost(message, optional, tag = "1")]
     pub memory: ::core::option::Option<Memory>,
@@ -156,6 +171,39 @@ pub struct MemoryListResponse {
     #[prost(message, repeated, tag = "1")]
     pub memories: ::prost::alloc::vec::Vec<Memory>,
 }
+/// One result per request, in request order; `call_id` is the request's index.
+#[derive(Clone, PartialEq, ::prost::Message)]
+pub struct SearchMemoriesBatchResponse {
+    #[prost(message, repeated, tag = "1")]
+    pub results: ::prost::alloc::vec::Vec<SearchMemoriesResult>,
+}
+/// A search that failed, reported in band so it does not fail the enclosing
+/// batch or stream. `code` is a google.rpc.Code value.
+#[derive(Clone, PartialEq, Eq, Hash, ::prost::Message)]
+pub struct SearchError {
+    #[prost(int32, tag = "1")]
+    pub code: i32,
+    #[prost(string, tag = "2")]
+    pub message: ::prost::alloc::string::String,
+}
+/// Outcome of one query on SearchMemoriesBatch or SearchMemoriesStream.
+#[derive(Clone, PartialEq, ::prost::Message)]
+pub struct SearchMemoriesResult {
+    #[prost(uint64, tag = "3")]
+    pub call_id: u64,
+    #[prost(oneof = "search_memories_result::Result", tags = "1, 2")]
+    pub result: ::core::option::Option<search_memories_result::Result>,
+}
+/// Nested message and enum types in `SearchMemoriesResult`.
+pub mod search_memories_result {
+    #[derive(Clone, PartialEq, ::prost::Oneof)]
+    pub enum Result {
+        #[prost(message, tag = "1")]
+        Response(super::MemoryListResponse),
+        #[prost(message, tag = "2")]
+        Error(super::SearchError),
+    }
+}
 #[derive(Clone, Copy, Debug, PartialEq, Eq, Hash, PartialOrd, Ord, ::prost::Enumeration)]
 #[repr(i32)]
 pub enum LifecycleState {
@@ -424,6 +472,46 @@ pub mod memory_service_client {
                 .insert(GrpcMethod::new("memory_v1.MemoryService", "SearchMemories"));
             self.inner.unary(req, path, codec).await
         }
+        pub async fn search_memories_batch(
+            &mut self,
+            request: impl tonic::IntoRequest<super::SearchMemoriesBatchRequest>,
+        ) -> std::result::Result<tonic::Response<super::SearchMemoriesBatchResponse>, tonic::Status>
+        {
+            self.inner.ready().await.map_err(|e| {
+                tonic::Status::unknown(format!("Service was not ready: {}", e.into()))
+            })?;
+            let codec = tonic_prost::ProstCodec::default();
+            let path = http::uri::PathAndQuery::from_static(
+                "/memory_v1.MemoryService/SearchMemoriesBatch",
+            );
+            let mut req = request.into_request();
+            req.extensions_mut().insert(GrpcMethod::new(
+                "memory_v1.MemoryService",
+                "SearchMemoriesBatch",
+            ));
+            self.inner.unary(req, path, codec).await
+        }
+        pub async fn search_memories_stream(
+            &mut self,
+            request: impl tonic::IntoStreamingRequest<Message = super::SearchMemoriesStreamRequest>,
+        ) -> std::result::Result<
+            tonic::Response<tonic::codec::Streaming<super::SearchMemoriesResult>>,
+            tonic::Status,
+        > {
+            self.inner.ready().await.map_err(|e| {
+                tonic::Status::unknown(format!("Service was not ready: {}", e.into()))
+            })?;
+            let codec = tonic_prost::ProstCodec::default();
+            let path = http::uri::PathAndQuery::from_static(
+                "/memory_v1.MemoryService/SearchMemoriesStream",
+            );
+            let mut req = request.into_streaming_request();
+            req.extensions_mut().insert(GrpcMethod::new(
+                "memory_v1.MemoryService",
+                "SearchMemoriesStream",
+            ));
+            self.inner.streaming(req, path, codec).await
+        }
     }
 }
 /// Generated server implementations.
@@ -459,6 +547,19 @@ pub mod memory_service_server {
             &self,
             request: tonic::Request<super::SearchMemoriesRequest>,
         ) -> std::result::Result<tonic::Response<super::MemoryListResponse>, tonic::Status>;
+        async fn search_memories_batch(
+            &self,
+            request: tonic::Request<super::SearchMemoriesBatchRequest>,
+        ) -> std::result::Result<tonic::Response<super::SearchMemoriesBatchResponse>, tonic::Status>;
+        /// Server streaming response type for the SearchMemoriesStream method.
+        type SearchMemoriesStreamStream: tonic::codegen::tokio_stream::Stream<
+                Item = std::result::Result<super::SearchMemoriesResult, tonic::Status>,
+            > + std::marker::Send
+            + 'static;
+        async fn search_memories_stream(
+            &self,
+            request: tonic::Request<tonic::Streaming<super::SearchMemoriesStreamRequest>>,
+        ) -> std::result::Result<tonic::Response<Self::SearchMemoriesStreamStream>, tonic::Status>;
     }
     #[derive(Debug)]
     pub struct MemoryServiceServer<T> {
@@ -736,6 +837,94 @@ pub mod memory_service_server {
                     };
                     Box::pin(fut)
                 }
+                "/memory_v1.MemoryService/SearchMemoriesBatch" => {
+                    #[allow(non_camel_case_types)]
+                    struct SearchMemoriesBatchSvc<T: MemoryService>(pub Arc<T>);
+                    impl<T: MemoryService>
+                        tonic::server::UnaryService<super::SearchMemoriesBatchRequest>
+                        for SearchMemoriesBatchSvc<T>
+                    {
+                        type Response = super::SearchMemoriesBatchResponse;
+                        type Future = BoxFuture<tonic::Response<Self::Response>, tonic::Status>;
+                        fn call(
+                            &mut self,
+                            request: tonic::Request<super::SearchMemoriesBatchRequest>,
+                        ) -> Self::Future {
+                            let inner = Arc::clone(&self.0);
+                            let fut = async move {
+                                <T as MemoryService>::search_memories_batch(&inner, request).await
+                            };
+                            Box::pin(fut)
+                        }
+                    }
+                    let accept_compression_encodings = self.accept_compression_encodings;
+                    let send_compression_encodings = self.send_compression_encodings;
+                    let max_decoding_message_size = self.max_decoding_message_size;
+                    let max_encoding_message_size = self.max_encoding_message_size;
+                    let inner = self.inner.clone();
+                    let fut = async move {
+                        let method = SearchMemoriesBatchSvc(inner);
+                        let codec = tonic_prost::ProstCodec::default();
+                        let mut grpc = tonic::server::Grpc::new(codec)
+                            .apply_compression_config(
+                                accept_compression_encodings,
+                                send_compression_encodings,
+                            )
+                            .apply_max_message_size_config(
+                                max_decoding_message_size,
+                                max_encoding_message_size,
+                            );
+                        let res = grpc.unary(method, req).await;
+                        Ok(res)
+                    };
+                    Box::pin(fut)
+                }
+                "/memory_v1.MemoryService/SearchMemoriesStream" => {
+                    #[allow(non_camel_case_types)]
+                    struct SearchMemoriesStreamSvc<T: MemoryService>(pub Arc<T>);
+                    impl<T: MemoryService>
+                        tonic::server::StreamingService<super::SearchMemoriesStreamRequest>
+                        for SearchMemoriesStreamSvc<T>
+                    {
+                        type Response = super::SearchMemoriesResult;
+                        type ResponseStream = T::SearchMemoriesStreamStream;
+                        type Future =
+                            BoxFuture<tonic::Response<Self::ResponseStream>, tonic::Status>;
+                        fn call(
+                            &mut self,
+                            request: tonic::Request<
+                                tonic::Streaming<super::SearchMemoriesStreamRequest>,
+                            >,
+                        ) -> Self::Future {
+                            let inner = Arc::clone(&self.0);
+                            let fut = async move {
+                                <T as MemoryService>::search_memories_stream(&inner, request).await
+                            };
+                            Box::pin(fut)
+                        }
+                    }
+                    let accept_compression_encodings = self.accept_compression_encodings;
+                    let send_compression_encodings = self.send_compression_encodings;
+                    let max_decoding_message_size = self.max_decoding_message_size;
+                    let max_encoding_message_size = self.max_encoding_message_size;
+                    let inner = self.inner.clone();
+                    let fut = async move {
+                        let method = SearchMemoriesStreamSvc(inner);
+                        let codec = tonic_prost::ProstCodec::default();
+                        let mut grpc = tonic::server::Grpc::new(codec)
+                            .apply_compression_config(
+                                accept_compression_encodings,
+                                send_compression_encodings,
+                            )
+                            .apply_max_message_size_config(
+                                max_decoding_message_size,
+                                max_encoding_message_size,
+                            );
+                        let res = grpc.streaming(method, req).await;
+                        Ok(res)
+                    };
+                    Box::pin(fut)
+                }
                 _ => Box::pin(async move {
                     let mut response = http::Response::new(tonic::body::Body::default());
                     let headers = response.headers_mut();
@@ -1,23 +1,47 @@
 #!/usr/bin/env python3
 """
 Python program to test gRPC SearchMemories endpoint with randomized queries.
-Uses grpcurl under the hood to make the calls.
+Uses a native grpc.aio client built from crates/umem_proto/proto/memory.proto,
+so it requires the `grpcio` and `grpcio-tools` packages.
+
+`--executor thread` dispatches blocking calls from a thread pool instead. That
+only pays off on a free-threaded interpreter, e.g.
+`python3.13t test_grpc_queries.py --executor thread`; under the GIL the default
+asyncio executor is faster.
 """
 
-import subprocess
-import json
+import asyncio
+import itertools
 import random
-import time
+import sys
+import threading
+import multiprocessing
 import argparse
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, List
 from dataclasses import dataclass
 
+import grpc
+
+try:
+    import numpy as np
+except ImportError:  # numpy only speeds up bulk query generation
+    np = None
+
+PROTO_DIR = Path(__file__).resolve().parent / "crates" / "umem_proto" / "proto"
+sys.path.append(str(PROTO_DIR))
+
+memory_v1_pb2, memory_v1_pb2_grpc = grpc.protos_and_services("memory.proto")
+
 
 @dataclass
 class GrpcConfig:
     host: str = "localhost"
     port: int = 5051
-    service: str = "memory_v1.MemoryService/SearchMemories"
+    pool_size: int = 4
+    multiplex: bool = False
+    keep_responses: bool = False
 
     @property
     def endpoint(self) -> str:
@@ -52,33 +76,44 @@ class QueryGenerator:
     }
 
     def __init__(self, seed: Optional[int] = None):
-        if seed is not None:
-            random.seed(seed)
+        # Per-instance RNG so independent generators don't share global state
+        self._rng = random.Random(seed)
+        self._categories = tuple(self.QUERY_SEEDS.keys())
+        self._non_adj_categories = tuple(
+            category for category in self._categories if category != "adjectives"
+        )
+        if np is not None:
+            self._build_arrays()
+
+    def _build_arrays(self) -> None:
+        """Flatten QUERY_SEEDS into numpy arrays for vectorized draws in bulk()."""
+        seeds = [self.QUERY_SEEDS[category] for category in self._categories]
+        self._words = np.array([word for words in seeds for word in words])
+        self._lengths = np.array([len(words) for words in seeds])
+        self._offsets = np.concatenate(([0], np.cumsum(self._lengths)[:-1]))
+        self._category_ids = np.arange(len(self._categories))
+        self._non_adj_ids = np.array(
+            [self._categories.index(category) for category in self._non_adj_categories]
+        )
+        self._adjective_id = self._categories.index("adjectives")
+        self._action_id = self._categories.index("actions")
 
     def random_simple_query(self) -> str:
         """Generate a simple 1-2 word query."""
-        category = random.choice(list(self.QUERY_SEEDS.keys()))
-        word = random.choice(self.QUERY_SEEDS[category])
-        return word
+        category = self._rng.choice(self._categories)
+        return self._rng.choice(self.QUERY_SEEDS[category])
 
     def random_phrase_query(self) -> str:
         """Generate a multi-word query like 'perfect pasta'."""
-        adjective = random.choice(self.QUERY_SEEDS["adjectives"])
-        category = random.choice(list(self.QUERY_SEEDS.keys()))
-        if category == "adjectives":
-            category = "food"
-        noun = random.choice(self.QUERY_SEEDS[category])
+        adjective = self._rng.choice(self.QUERY_SEEDS["adjectives"])
+        category = self._rng.choice(self._non_adj_categories)
+        noun = self._rng.choice(self.QUERY_SEEDS[category])
         return f"{adjective} {noun}"
 
     def random_sentence_query(self) -> str:
         """Generate a sentence-like query."""
-        action = random.choice(self.QUERY_SEEDS["actions"])
-        adjective = random.choice(self.QUERY_SEEDS["adjectives"])
-        category = random.choice(list(self.QUERY_SEEDS.keys()))
-        if category == "adjectives":
-            category = "food"
-        noun = random.choice(self.QUERY_SEEDS[category])
-        return f"{action} {adjective} {noun}"
+        action = self._rng.choice(self.QUERY_SEEDS["actions"])
+        return f"{action} {self.random_phrase_query()}"
 
     def random_query(self, query_type: str = "any") -> str:
         """Generate a random query of specified type."""
@@ -89,105 +124,408 @@ class QueryGenerator:
         }
 
         if query_type == "any":
-            query_type = random.choice(["simple", "phrase", "sentence"])
+            query_type = self._rng.choice(["simple", "phrase", "sentence"])
 
         generator = query_types.get(query_type, self.random_simple_query)
         return generator()
 
+    def bulk(self, n: int, query_type: str = "any") -> List[str]:
+        """
+        Generate n queries of the specified type in one go. With numpy installed
+        all words are drawn in a handful of vectorized calls; otherwise this
+        falls back to calling random_query n times. The two paths draw words
+        differently, so a seed only reproduces the same queries with the same
+        generator.
+        """
+        if np is None:
+            return [self.random_query(query_type) for _ in range(n)]
+
+        # Seed numpy from the instance RNG so bulk output is reproducible too
+        rng = np.random.default_rng(self._rng.getrandbits(64))
+
+        def words(category_ids):
+            category_ids = np.broadcast_to(category_ids, n)
+            offsets = self._offsets[category_ids]
+            return self._words[offsets + rng.integers(0, self._lengths[category_ids])]
+
+        def simple():
+            return words(rng.choice(self._category_ids, n))
+
+        def phrase():
+            adjectives = words(self._adjective_id)
+            nouns = words(rng.choice(self._non_adj_ids, n))
+            return np.char.add(np.char.add(adjectives, " "), nouns)
+
+        def sentence():
+            return np.char.add(np.char.add(words(self._action_id), " "), phrase())
+
+        query_types = {"simple": simple, "phrase": phrase, "sentence": sentence}
+
+        if query_type != "any":
+            return query_types.get(query_type, simple)().tolist()
+
+        # Draw every type for every slot, then pick one column per query
+        candidates = np.stack([simple(), phrase(), sentence()])
+        picks = rng.integers(0, len(candidates), n)
+        return candidates[picks, np.arange(n)].tolist()
+
+
+CHANNEL_OPTIONS = [
+    # A local subchannel pool keeps pooled channels from sharing one connection
+    ("grpc.use_local_subchannel_pool", 1),
+    # Keepalive pings, sent even while no call is active, stop idle pooled
+    # connections from being reaped between bursts of a long benchmark run
+    ("grpc.keepalive_time_ms", 20_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    # Read further ahead per stream than the 64KiB default so large memory
+    # lists aren't throttled by flow control
+    ("grpc.http2.lookahead_bytes", 4 << 20),
+    ("grpc.max_receive_message_length", 64 << 20),
+]
+
+
+def build_request_template(
+    user_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+):
+    """
+    Build a SearchMemoriesRequest carrying the context shared by every request.
+    The context is left unset if no ids are given.
+    """
+    context = {
+        key: value
+        for key, value in (
+            ("user_id", user_id),
+            ("agent_id", agent_id),
+            ("run_id", run_id),
+        )
+        if value
+    }
+    if not context:
+        return memory_v1_pb2.SearchMemoriesRequest()
+    return memory_v1_pb2.SearchMemoriesRequest(
+        context=memory_v1_pb2.ContextFilter(**context)
+    )
+
 
-class GrpcClient:
-    """Client for interacting with gRPC service via grpcurl."""
+def fill_request(request, template, query: str):
+    """
+    Copy the template into `request` and set the query. CopyFrom duplicates the
+    context in one C-level call instead of building a new submessage per request.
+    """
+    request.CopyFrom(template)
+    request.query = query
+    return request
 
-    def __init__(self, config: GrpcConfig):
-        self.config = config
 
-    def search_memories(
+@dataclass(slots=True, frozen=True)
+class SearchResult:
+    """Outcome of a single query; slotted since one is created per request."""
+
+    success: bool
+    query: str
+    memory_count: int = 0
+    error: Optional[str] = None
+    response: Optional[Any] = None
+
+
+def success_result(query: str, response, keep_response: bool = False) -> SearchResult:
+    """Build a result from a MemoryListResponse, keeping the message only if asked."""
+    return SearchResult(
+        success=True,
+        query=query,
+        memory_count=len(response.memories),
+        # Only hold on to the decoded memories when they will be printed
+        response=response if keep_response else None,
+    )
+
+
+def failure_result(query: str, error: str) -> SearchResult:
+    """Build a result for a query whose RPC failed with the given error."""
+    return SearchResult(success=False, query=query, error=error)
+
+
+# SearchError carries a google.rpc.Code value; map it back to the status name
+STATUS_CODE_NAMES = {code.value[0]: code.name for code in grpc.StatusCode}
+
+
+def result_from_message(query: str, message, keep_response: bool = False) -> SearchResult:
+    """Build a result from a SearchMemoriesResult, which holds a response or an error."""
+    if message.HasField("error"):
+        code = STATUS_CODE_NAMES.get(message.error.code, str(message.error.code))
+        return failure_result(query, f"{code}: {message.error.message}")
+    return success_result(query, message.response, keep_response)
+
+
+class MultiplexedStream:
+    """
+    A long-lived SearchMemoriesStream used to carry unary-style calls.
+    Each call is framed with a call_id that the server echoes on its result,
+    so results resolve their own call whatever order they arrive in, and a
+    failed search only fails that call.
+    """
+
+    def __init__(self, stub):
+        self._requests: asyncio.Queue = asyncio.Queue()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._call_ids = itertools.count()
+        self._call = stub.SearchMemoriesStream(self._request_iter())
+        self._reader = asyncio.ensure_future(self._read())
+
+    @property
+    def closed(self) -> bool:
+        return self._reader.done()
+
+    async def _request_iter(self):
+        while (request := await self._requests.get()) is not None:
+            yield request
+
+    async def _read(self) -> None:
+        error: Exception = ConnectionError("SearchMemoriesStream closed")
+        try:
+            async for message in self._call:
+                # Absent if the caller already timed out; the late result is dropped
+                future = self._pending.pop(message.call_id, None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except Exception as e:
+            error = e
+            self._call.cancel()
+        finally:
+            # However the reader stops (including cancellation), fail every
+            # in-flight call now rather than leaving it to hit its timeout
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    async def search(self, request, timeout: float):
+        """Send one SearchMemoriesRequest; returns its SearchMemoriesResult."""
+        call_id = next(self._call_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[call_id] = future
+        self._requests.put_nowait(
+            memory_v1_pb2.SearchMemoriesStreamRequest(call_id=call_id, request=request)
+        )
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(call_id, None)
+
+    async def close(self) -> None:
+        self._requests.put_nowait(None)
+        await self._reader
+
+
+class GrpcClient:
+    """
+    Client for interacting with the gRPC service over a pool of grpc.aio channels.
+    Each channel is its own HTTP/2 connection, so RPCs are spread round-robin
+    across them instead of queueing behind one connection's stream limit.
+    """
+
+    def __init__(
         self,
-        query: str,
+        config: GrpcConfig,
         user_id: Optional[str] = None,
         agent_id: Optional[str] = None,
         run_id: Optional[str] = None,
-    ) -> Dict:
+    ):
+        self.config = config
+        # The context is identical for every request, so build it only once
+        self._request_template = build_request_template(user_id, agent_id, run_id)
+        self._channels = [
+            grpc.aio.insecure_channel(config.endpoint, options=CHANNEL_OPTIONS)
+            for _ in range(config.pool_size)
+        ]
+        self._stubs = [
+            memory_v1_pb2_grpc.MemoryServiceStub(channel) for channel in self._channels
+        ]
+        self._rr = itertools.count()
+        # Opened lazily, one per channel, when multiplexing is enabled
+        self._streams: List[Optional[MultiplexedStream]] = [None] * config.pool_size
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            *(stream.close() for stream in self._streams if stream is not None)
+        )
+        await asyncio.gather(*(channel.close() for channel in self._channels))
+
+    async def search_memories(self, query: str) -> SearchResult:
+        """
+        Call SearchMemories gRPC endpoint with the given query and the client's context.
+        Returns a SearchResult; the MemoryListResponse is only kept on it when
+        the client is configured with keep_responses (verbose mode).
+        """
+        request = self._request(query)
+
+        try:
+            if self.config.multiplex:
+                message = await self._checkout_stream().search(request, timeout=10)
+                return result_from_message(query, message, self.config.keep_responses)
+            response = await self._next_stub().SearchMemories(request, timeout=10)
+            return success_result(query, response, self.config.keep_responses)
+
+        except grpc.aio.AioRpcError as e:
+            return failure_result(query, f"{e.code().name}: {e.details()}")
+        except asyncio.TimeoutError:
+            return failure_result(query, "Request timed out")
+        except Exception as e:
+            return failure_result(query, str(e))
+
+    async def search_memories_batch(self, queries: List[str]) -> List[SearchResult]:
         """
-        Call SearchMemories gRPC endpoint with the given query and context.
-        Returns parsed JSON response.
+        Call SearchMemoriesBatch gRPC endpoint with all queries in a single RPC.
+        Returns one result per query, in request order. A failed search only
+        fails its own query; if the RPC itself fails, every query does.
         """
-        # Build the request JSON
-        request = {"query": query}
-
-        context = {}
-        if user_id:
-            context["user_id"] = user_id
-        if agent_id:
-            context["agent_id"] = agent_id
-        if run_id:
-            context["run_id"] = run_id
-
-        if context:
-            request["context"] = context
-
-        # Build grpcurl command
-        cmd = [
-            "grpcurl",
-            "-plaintext",
-            "-d",
-            json.dumps(request),
-            self.config.endpoint,
-            self.config.service,
+        request = memory_v1_pb2.SearchMemoriesBatchRequest()
+        for query in queries:
+            fill_request(request.requests.add(), self._request_template, query)
+
+        try:
+            batch = await self._next_stub().SearchMemoriesBatch(request, timeout=10)
+            return [
+                result_from_message(query, message, self.config.keep_responses)
+                for query, message in zip(queries, batch.results)
+            ]
+
+        except grpc.aio.AioRpcError as e:
+            error = f"{e.code().name}: {e.details()}"
+            return [failure_result(query, error) for query in queries]
+        except Exception as e:
+            return [failure_result(query, str(e)) for query in queries]
+
+    async def search_memories_stream(self, queries: List[str]) -> AsyncIterator[SearchResult]:
+        """
+        Send all queries down one SearchMemoriesStream bidirectional stream,
+        using each query's index as its call_id. Yields one result per query as
+        responses arrive, in completion order. A failed search only fails its
+        own query; queries left unanswered when the stream itself breaks are
+        all reported with that error.
+        """
+
+        async def request_iter():
+            for call_id, query in enumerate(queries):
+                message = memory_v1_pb2.SearchMemoriesStreamRequest(call_id=call_id)
+                fill_request(message.request, self._request_template, query)
+                yield message
+
+        # One byte per query rather than a set of ids, to stay small for large runs
+        answered = bytearray(len(queries))
+        try:
+            call = self._next_stub().SearchMemoriesStream(request_iter())
+            async for message in call:
+                answered[message.call_id] = 1
+                yield result_from_message(
+                    queries[message.call_id], message, self.config.keep_responses
+                )
+            error = "SearchMemoriesStream closed"
+
+        except grpc.aio.AioRpcError as e:
+            error = f"{e.code().name}: {e.details()}"
+        except Exception as e:
+            error = str(e)
+
+        for query, done in zip(queries, answered):
+            if not done:
+                yield failure_result(query, error)
+
+    def _request(self, query: str):
+        return fill_request(
+            memory_v1_pb2.SearchMemoriesRequest(), self._request_template, query
+        )
+
+    def _next_stub(self):
+        return self._stubs[next(self._rr) % len(self._stubs)]
+
+    def _checkout_stream(self) -> MultiplexedStream:
+        index = next(self._rr) % len(self._stubs)
+        stream = self._streams[index]
+        if stream is None or stream.closed:
+            stream = self._streams[index] = MultiplexedStream(self._stubs[index])
+        return stream
+
+
+class SyncGrpcClient:
+    """
+    Blocking counterpart of GrpcClient for thread-pool dispatch. Threads only
+    make progress in parallel on a free-threaded (3.13t) interpreter; under the
+    GIL the asyncio client is the better choice.
+    """
+
+    def __init__(
+        self,
+        config: GrpcConfig,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ):
+        self.config = config
+        self._request_template = build_request_template(user_id, agent_id, run_id)
+        self._channels = [
+            grpc.insecure_channel(config.endpoint, options=CHANNEL_OPTIONS)
+            for _ in range(config.pool_size)
+        ]
+        self._stubs = [
+            memory_v1_pb2_grpc.MemoryServiceStub(channel) for channel in self._channels
         ]
+        self._rr = itertools.count()
+        self._rr_lock = threading.Lock()
+
+    def close(self) -> None:
+        for channel in self._channels:
+            channel.close()
+
+    def _request(self, query: str):
+        return fill_request(
+            memory_v1_pb2.SearchMemoriesRequest(), self._request_template, query
+        )
+
+    def search_memories(self, query: str) -> SearchResult:
+        """Call SearchMemories gRPC endpoint, blocking the calling thread."""
+        request = self._request(query)
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.returncode != 0:
-                return {
-                    "success": False,
-                    "error": result.stderr,
-                    "query": query,
-                }
-
-            # Parse the response
-            response = json.loads(result.stdout)
-            return {
-                "success": True,
-                "query": query,
-                "response": response,
-                "memory_count": len(response.get("memories", [])),
-            }
-
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "error": "Request timed out",
-                "query": query,
-            }
-        except json.JSONDecodeError as e:
-            return {
-                "success": False,
-                "error": f"Failed to parse response: {e}",
-                "query": query,
-                "raw_output": result.stdout,
-            }
+            with self._rr_lock:
+                stub = self._stubs[next(self._rr) % len(self._stubs)]
+            response = stub.SearchMemories(request, timeout=10)
+            return success_result(query, response, self.config.keep_responses)
+
+        except grpc.RpcError as e:
+            return failure_result(query, f"{e.code().name}: {e.details()}")
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "query": query,
-            }
+            return failure_result(query, str(e))
+
+
+class RateLimiter:
+    """
+    Token bucket holding a single token: calls to acquire() are spaced evenly so
+    that at most `rate` of them start per second.
+    """
 
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
 
-def format_result(result: Dict) -> str:
+    async def acquire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        # Reserve the next free slot before sleeping so concurrent callers queue up
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def format_result(result: SearchResult) -> str:
     """Format a single result for display."""
-    if not result["success"]:
-        return f"❌ Query: '{result['query']}' | Error: {result['error']}"
+    if not result.success:
+        return f"❌ Query: '{result.query}' | Error: {result.error}"
 
-    memory_count = result.get("memory_count", 0)
-    return f"✓ Query: '{result['query']}' | Found {memory_count} memories"
+    return f"✓ Query: '{result.query}' | Found {result.memory_count} memories"
 
 
 def main():
@@ -227,12 +565,67 @@ def main():
         default="any",
         help="Type of queries to generate (default: any)",
     )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=32,
+        help="Maximum number of in-flight requests, split evenly across "
+        "workers (default: 32)",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Queries per SearchMemoriesBatch RPC; 1 uses unary SearchMemories. "
+        "Failed searches are reported per query, but a failed RPC fails the "
+        "whole batch (default: 1)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Send all queries over one SearchMemoriesStream bidirectional stream",
+    )
+    parser.add_argument(
+        "-m",
+        "--multiplex",
+        action="store_true",
+        help="Carry each SearchMemories call over a pooled long-lived stream",
+    )
+    parser.add_argument(
+        "-e",
+        "--executor",
+        choices=["asyncio", "thread"],
+        default="asyncio",
+        help="Dispatch over grpc.aio, or blocking grpcio calls on a thread pool "
+        "(only scales on free-threaded Python 3.13t) (default: asyncio)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to split the queries across, each with its own "
+        "event loop and channel pool (default: 1)",
+    )
+    parser.add_argument(
+        "-p",
+        "--pool-size",
+        type=int,
+        default=4,
+        help="Number of gRPC channels to round-robin requests across (default: 4)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="Maximum RPCs started per second (optional, default: unlimited)",
+    )
     parser.add_argument(
         "-d",
         "--delay",
         type=float,
-        default=0.1,
-        help="Delay between requests in seconds (default: 0.1)",
+        help="Deprecated and ignored; use --rate instead",
     )
     parser.add_argument(
         "-s",
@@ -259,59 +652,203 @@ def main():
     )
 
     args = parser.parse_args()
+    if sum((args.stream, args.multiplex, args.batch_size > 1)) > 1:
+        parser.error("--stream, --multiplex and --batch-size > 1 are mutually exclusive")
+    if args.executor == "thread" and (
+        args.stream or args.multiplex or args.batch_size > 1
+    ):
+        parser.error("--executor thread only supports unary SearchMemories calls")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.pool_size < 1:
+        parser.error("--pool-size must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.concurrency < args.workers:
+        parser.error("--concurrency must be at least --workers")
+    if args.rate is not None and args.rate <= 0:
+        parser.error("--rate must be positive")
+    if args.rate is not None and args.stream:
+        parser.error("--rate does not apply to --stream")
+    if args.delay is not None:
+        print("warning: --delay is deprecated and has no effect; use --rate", file=sys.stderr)
+
+    run(args)
+
+
+def rpc_method(args: argparse.Namespace) -> str:
+    """Name of the MemoryService RPC the selected mode sends queries with."""
+    if args.stream or args.multiplex:
+        return "SearchMemoriesStream"
+    if args.batch_size > 1:
+        return "SearchMemoriesBatch"
+    return "SearchMemories"
+
+
+def build_config(args: argparse.Namespace) -> GrpcConfig:
+    return GrpcConfig(
+        host=args.host,
+        port=args.port,
+        pool_size=args.pool_size,
+        multiplex=args.multiplex,
+        keep_responses=args.verbose,
+    )
 
-    # Initialize client and query generator
-    config = GrpcConfig(host=args.host, port=args.port)
-    client = GrpcClient(config)
+
+def run(args: argparse.Namespace) -> None:
+    config = build_config(args)
     generator = QueryGenerator(seed=args.seed)
 
     print(f"Testing gRPC endpoint at {config.endpoint}")
-    print(f"Service: {config.service}")
+    print(f"Service: memory_v1.MemoryService/{rpc_method(args)}")
     print(f"Sending {args.num_queries} queries with user_id='{args.user_id}'")
     print(f"Query type: {args.query_type}")
+    per_worker = worker_concurrency(args)
+    print(
+        f"Concurrency: {per_worker * args.workers} over "
+        f"{config.pool_size * args.workers} channels ({args.executor} executor)"
+    )
+    if args.workers > 1:
+        print(
+            f"Worker processes: {args.workers}, each with {per_worker} in flight "
+            f"over its own pool of {config.pool_size} channels"
+        )
+    if args.stream:
+        print("Mode: single SearchMemoriesStream")
+    elif args.multiplex:
+        print(f"Mode: calls multiplexed over {config.pool_size} SearchMemoriesStreams")
+    elif args.batch_size > 1:
+        print(f"Batch size: {args.batch_size}")
+    if args.rate is not None:
+        print(f"Rate limit: {args.rate} RPCs/s")
+    print(f"Query generator: {'numpy' if np is not None else 'random'}")
     if args.seed is not None:
         print(f"Random seed: {args.seed}")
     print("-" * 80)
 
-    results: List[Dict] = []
-    successful = 0
-    failed = 0
+    # Generate the whole corpus up front so task bodies only await the RPC,
+    # and the query set depends on the seed alone, not on completion order
+    queries = generator.bulk(args.num_queries, query_type=args.query_type)
+
+    if args.workers > 1:
+        jobs = [
+            (args, f"w{index} ", queries[index :: args.workers])
+            for index in range(args.workers)
+        ]
+        counts = [0, 0]
+        # spawn rather than fork: forking a process that has touched asyncio or
+        # grpc's internal threads leaves the child with broken state
+        with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+            for successful, failed in pool.imap_unordered(run_worker, jobs):
+                counts[0] += successful
+                counts[1] += failed
+    else:
+        counts = asyncio.run(run_chunk(args, queries))
+
+    print("-" * 80)
+    print(f"Results: {counts[0]} successful, {counts[1]} failed")
+    if args.seed is not None:
+        print(
+            f"To reproduce these results, use: --seed {args.seed} "
+            f"(with numpy {'installed' if np is not None else 'not installed'})"
+        )
+
 
-    for i in range(args.num_queries):
-        # Generate random query
-        query = generator.random_query(query_type=args.query_type)
+def worker_concurrency(args: argparse.Namespace) -> int:
+    """In-flight request limit for each worker process."""
+    return args.concurrency // args.workers
 
-        # Make the request
-        result = client.search_memories(
-            query=query,
+
+def run_worker(job) -> List[int]:
+    """Worker process entry point: send one slice of the queries."""
+    args, label, queries = job
+    # One write per line keeps output from different workers from interleaving
+    sys.stdout.reconfigure(line_buffering=True, write_through=False)
+    return asyncio.run(run_chunk(args, queries, label))
+
+
+async def run_chunk(
+    args: argparse.Namespace, queries: List[str], label: str = ""
+) -> List[int]:
+    """Send the given queries, printing each result; returns [successful, failed]."""
+    config = build_config(args)
+    # Workers split the overall concurrency between them
+    concurrency = worker_concurrency(args)
+    executor: Optional[ThreadPoolExecutor] = None
+    if args.executor == "thread":
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        client = SyncGrpcClient(
+            config,
             user_id=args.user_id,
             agent_id=args.agent_id,
             run_id=args.run_id,
         )
+    else:
+        client = GrpcClient(
+            config,
+            user_id=args.user_id,
+            agent_id=args.agent_id,
+            run_id=args.run_id,
+        )
+
+    # Workers split the overall rate limit between them
+    limiter = (
+        RateLimiter(args.rate / args.workers) if args.rate is not None else None
+    )
 
-        results.append(result)
+    async def call(batch: List[str]) -> List[SearchResult]:
+        if limiter is not None:
+            await limiter.acquire()
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            return [
+                await loop.run_in_executor(executor, client.search_memories, batch[0])
+            ]
+        if args.batch_size > 1:
+            return await client.search_memories_batch(batch)
+        return [await client.search_memories(batch[0])]
+
+    # [successful, failed]; each result is printed and then dropped, not retained
+    counts = [0, 0]
+
+    def report(result: SearchResult) -> None:
+        counts[0 if result.success else 1] += 1
 
         # Print result
-        print(f"[{i + 1}/{args.num_queries}] {format_result(result)}")
-
-        if result["success"]:
-            successful += 1
-            if args.verbose and result.get("response"):
-                memories = result["response"].get("memories", [])
-                for memory in memories[:2]:  # Show first 2 memories
-                    summary = memory.get("content", {}).get("summary", "N/A")
-                    print(f"    └─ {summary[:70]}")
-        else:
-            failed += 1
-
-        # Add delay between requests
-        if i < args.num_queries - 1:
-            time.sleep(args.delay)
+        print(f"[{label}{sum(counts)}/{len(queries)}] {format_result(result)}")
+
+        if args.verbose and result.response is not None:
+            memories = result.response.memories
+            for memory in memories[:2]:  # Show first 2 memories
+                summary = memory.content.summary or "N/A"
+                print(f"    └─ {summary[:70]}")
+
+    if args.stream:
+        async for result in client.search_memories_stream(queries):
+            report(result)
+    else:
+        batch_size = max(args.batch_size, 1)
+        batches = (
+            queries[i : i + batch_size] for i in range(0, len(queries), batch_size)
+        )
 
-    print("-" * 80)
-    print(f"Results: {successful} successful, {failed} failed")
-    if args.seed is not None:
-        print(f"To reproduce these results, use: --seed {args.seed}")
+        # A fixed set of consumers pull from the shared iterator, so at most
+        # `concurrency` batches are in flight and results are printed as they
+        # arrive, without a task object per batch
+        async def consume() -> None:
+            for batch in batches:
+                for result in await call(batch):
+                    report(result)
+
+        await asyncio.gather(*(consume() for _ in range(concurrency)))
+
+    if executor is not None:
+        executor.shutdown()
+        client.close()
+    else:
+        await client.close()
+
+    return counts
 
 
 if __name__ == "__main__":